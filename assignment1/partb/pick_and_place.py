@@ -22,6 +22,9 @@ class PickAndPlaceSimulation:
         self.objects = []
         self.target_locations = []
         self.animation_data = []
+        self.frame_positions = np.empty((0, robot_arm.num_joints + 1, 2), dtype=np.float32)
+        self._X = self.frame_positions[..., 0]
+        self._Y = self.frame_positions[..., 1]
         
         # Set up the plot
         self.fig, self.ax = plt.subplots(figsize=(12, 8))
@@ -60,12 +63,9 @@ class PickAndPlaceSimulation:
         Returns:
             array: Interpolated joint angles
         """
-        path = []
-        for i in range(steps):
-            t = i / (steps - 1)
-            interpolated = start_angles + t * (end_angles - start_angles)
-            path.append(interpolated)
-        return np.array(path)
+        start_angles = np.asarray(start_angles, dtype=float)
+        t = np.linspace(0.0, 1.0, steps)[:, np.newaxis]
+        return start_angles + t * (np.asarray(end_angles) - start_angles)
     
     def plan_pick_and_place(self):
         """
@@ -122,24 +122,14 @@ class PickAndPlaceSimulation:
             angles = self.animation_data[frame]
             self.robot.set_joint_angles(angles)
             
-            # Get current robot configuration
-            joint_positions = self.robot.get_joint_positions()
-            end_pos, _ = self.robot.forward_kinematics()
+            # Current robot configuration, precomputed for every frame
+            joint_positions = self.frame_positions[frame]
+            end_pos = joint_positions[-1]
             
             # Update arm visualization
-            self.arm_line.set_data(joint_positions[:, 0], joint_positions[:, 1])
+            self.arm_line.set_data(self._X[frame], self._Y[frame])
             self.joints_scatter.set_offsets(joint_positions[:-1])  # Exclude end effector
             self.end_effector.set_offsets([[end_pos[0], end_pos[1]]])
-            
-            # Update objects
-            if self.objects:
-                objects_array = np.array(self.objects)
-                self.objects_scatter.set_offsets(objects_array)
-            
-            # Update targets
-            if self.target_locations:
-                targets_array = np.array(self.target_locations)
-                self.targets_scatter.set_offsets(targets_array)
         
         return self.arm_line, self.joints_scatter, self.end_effector, self.objects_scatter, self.targets_scatter
     
@@ -148,6 +138,19 @@ class PickAndPlaceSimulation:
         # Plan the motion
         self.animation_data = self.plan_pick_and_place()
         
+        # Forward kinematics for the whole sequence in one batched call,
+        # kept as float32 with x/y column views for the per-frame updates
+        positions = self.robot.forward_kinematics_batch(self.animation_data)
+        self.frame_positions = np.ascontiguousarray(positions, dtype=np.float32)
+        self._X = self.frame_positions[..., 0]
+        self._Y = self.frame_positions[..., 1]
+        
+        # Objects and targets do not move during playback, so set them once
+        if self.objects:
+            self.objects_scatter.set_offsets(np.array(self.objects))
+        if self.target_locations:
+            self.targets_scatter.set_offsets(np.array(self.target_locations))
+        
         # Create animation
         anim = FuncAnimation(
             self.fig, self.update_animation, frames=len(self.animation_data),
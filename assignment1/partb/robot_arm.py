@@ -7,6 +7,33 @@ from matplotlib.animation import FuncAnimation
 from scipy.optimize import minimize
 import time
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional, fall back to plain NumPy
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _chain_positions(link_lengths, joint_angles):
+        """Joint positions of a planar chain, base first (compiled)"""
+        num_links = link_lengths.shape[0]
+        positions = np.zeros((num_links + 1, 2))
+        angle = 0.0
+        for i in range(num_links):
+            angle += joint_angles[i]
+            positions[i + 1, 0] = positions[i, 0] + link_lengths[i] * np.cos(angle)
+            positions[i + 1, 1] = positions[i, 1] + link_lengths[i] * np.sin(angle)
+        return positions
+else:
+    def _chain_positions(link_lengths, joint_angles):
+        """Joint positions of a planar chain, base first"""
+        cumulative_angles = np.cumsum(joint_angles)
+        positions = np.zeros((len(link_lengths) + 1, 2))
+        positions[1:, 0] = np.cumsum(link_lengths * np.cos(cumulative_angles))
+        positions[1:, 1] = np.cumsum(link_lengths * np.sin(cumulative_angles))
+        return positions
+
 
 class RoboticArm:
     """A 2D robotic arm with multiple joints for pick and place operations"""
@@ -19,7 +46,7 @@ class RoboticArm:
             link_lengths (list): Length of each link in the arm
             joint_limits (list): [(min_angle, max_angle)] for each joint in radians
         """
-        self.link_lengths = np.array(link_lengths)
+        self.link_lengths = np.array(link_lengths, dtype=float)
         self.num_joints = len(link_lengths)
         self.joint_angles = np.zeros(self.num_joints)
         
@@ -42,19 +69,33 @@ class RoboticArm:
         if joint_angles is None:
             joint_angles = self.joint_angles
         
-        # Calculate cumulative angles
-        cumulative_angles = np.cumsum(joint_angles)
-        
-        # Calculate joint positions
-        joint_positions = np.zeros((self.num_joints + 1, 2))
-        
-        for i in range(self.num_joints):
-            joint_positions[i + 1, 0] = joint_positions[i, 0] + self.link_lengths[i] * np.cos(cumulative_angles[i])
-            joint_positions[i + 1, 1] = joint_positions[i, 1] + self.link_lengths[i] * np.sin(cumulative_angles[i])
+        # Calculate joint positions (called on every IK objective evaluation)
+        joint_positions = _chain_positions(self.link_lengths, np.asarray(joint_angles, dtype=float))
         
         end_effector_pos = joint_positions[-1]
         return end_effector_pos, joint_positions
     
+    def forward_kinematics_batch(self, joint_angles):
+        """
+        Calculate joint positions for many configurations at once
+        
+        Args:
+            joint_angles (array): (N, num_joints) joint angles in radians
+            
+        Returns:
+            array: (N, num_joints + 1, 2) joint positions, base first
+        """
+        joint_angles = np.asarray(joint_angles, dtype=float).reshape(-1, self.num_joints)
+        
+        # Cumulative angles along each row, then all link vectors in one go
+        cumulative_angles = np.cumsum(joint_angles, axis=1)
+        link_vectors = np.stack([self.link_lengths * np.cos(cumulative_angles),
+                                 self.link_lengths * np.sin(cumulative_angles)], axis=-1)
+        
+        joint_positions = np.zeros((len(joint_angles), self.num_joints + 1, 2))
+        np.cumsum(link_vectors, axis=1, out=joint_positions[:, 1:])
+        return joint_positions
+    
     def inverse_kinematics(self, target_x, target_y, initial_guess=None):
         """
         Calculate inverse kinematics to reach target position
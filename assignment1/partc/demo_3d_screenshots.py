@@ -2,6 +2,7 @@
 Demo script for capturing 3D animation screenshots
 """
 import pybullet as p
+import numpy as np
 import time
 import sys
 import os
@@ -41,6 +42,26 @@ def capture_demo_screenshots():
         }
     ]
     
+    # The camera is the same for every pose, so build its matrices once
+    width, height = 1200, 800
+    view_matrix = p.computeViewMatrixFromYawPitchRoll(
+        cameraTargetPosition=[0, 0, 1],
+        distance=8.0,
+        yaw=45,
+        pitch=-30,
+        roll=0,
+        upAxisIndex=2
+    )
+    proj_matrix = p.computeProjectionMatrixFOV(
+        fov=60,
+        aspect=width/height,
+        nearVal=0.1,
+        farVal=100.0
+    )
+    
+    # Captured RGB frames are kept in memory rather than round-tripped through PNG files
+    frames = {}
+    
     # Capture screenshots for each pose
     for i, pose in enumerate(demo_poses):
         print(f"Capturing pose {i+1}/4: {pose['description']}")
@@ -53,34 +74,17 @@ def capture_demo_screenshots():
             p.stepSimulation()
             time.sleep(1.0/240.0)
         
-        # Capture screenshot
-        width, height = 1200, 800
-        view_matrix = p.computeViewMatrixFromYawPitchRoll(
-            cameraTargetPosition=[0, 0, 1],
-            distance=8.0,
-            yaw=45,
-            pitch=-30,
-            roll=0,
-            upAxisIndex=2
-        )
-        proj_matrix = p.computeProjectionMatrixFOV(
-            fov=60,
-            aspect=width/height,
-            nearVal=0.1,
-            farVal=100.0
-        )
-        
         # Get camera image
         img_data = p.getCameraImage(
             width, height, view_matrix, proj_matrix,
-            renderer=p.ER_BULLET_HARDWARE_OPENGL
+            renderer=p.ER_BULLET_HARDWARE_OPENGL,
+            flags=p.ER_NO_SEGMENTATION_MASK
         )
         
-        # Save image
-        filename = f"3d_robotic_arm_{pose['name']}.png"
-        # Note: In a real environment, you would save the image here
-        # For this demo, we'll just print the status
-        print(f"  Screenshot captured: {filename}")
+        # Keep the RGB channels of the (height, width, 4) RGBA buffer
+        rgba = np.asarray(img_data[2], dtype=np.uint8).reshape(height, width, 4)
+        frames[pose['name']] = rgba[:, :, :3].copy()
+        print(f"  Screenshot captured: {pose['name']} ({width}x{height})")
         print(f"  End effector position: {arm_sim.get_end_effector_position()}")
     
     # Run a short animation to show movement
@@ -106,7 +110,7 @@ def capture_demo_screenshots():
     # Clean up
     arm_sim.cleanup()
     
-    return True
+    return frames
 
 
 if __name__ == "__main__":
@@ -281,6 +281,10 @@ class PyBulletRoboticArm:
             [0.2, -0.5, 0.8, 0.0]
         ]
         
+        # Segment start poses and deltas, so each frame is one row-wise blend
+        poses = np.asarray(poses)
+        pose_deltas = np.diff(poses, axis=0)
+        
         start_time = time.time()
         pose_duration = duration / (len(poses) - 1)
         
@@ -298,21 +302,9 @@ class PyBulletRoboticArm:
                 current_pose_idx = len(poses) - 2
                 local_progress = 1.0
             
-            # Interpolate between current and next pose
-            current_pose = poses[current_pose_idx]
-            next_pose = poses[current_pose_idx + 1]
-            
-            interpolated_pose = []
-            for i in range(len(current_pose)):
-                interp_value = current_pose[i] + local_progress * (next_pose[i] - current_pose[i])
-                interpolated_pose.append(interp_value)
-            
-            # Apply smooth interpolation (ease in/out)
+            # Interpolate between current and next pose with ease in/out
             smooth_progress = 0.5 * (1 - math.cos(math.pi * local_progress))
-            final_pose = []
-            for i in range(len(current_pose)):
-                smooth_value = current_pose[i] + smooth_progress * (next_pose[i] - current_pose[i])
-                final_pose.append(smooth_value)
+            final_pose = poses[current_pose_idx] + smooth_progress * pose_deltas[current_pose_idx]
             
             # Set joint positions
             self.set_joint_positions(final_pose)
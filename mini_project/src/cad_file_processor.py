@@ -6,6 +6,7 @@ import os
 import sys
 import zipfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import numpy as np
 import trimesh
@@ -16,6 +17,63 @@ import pybullet_data
 from PIL import Image, ImageDraw, ImageFont
 import json
 
+# Static per-component scale factors, built once at import time
+_COMPONENT_SCALES = {
+    'main_body': 0.8,
+    'boom_arm': 1.2,
+    'hydraulic_cylinder': 0.6,
+    'excavator_bucket': 1.0,
+    'hydraulic_piston': 0.5,
+    'joint_pin': 0.3,
+    'stabilizer_leg': 0.7,
+    'complete_assembly': 1.0
+}
+
+# Copy buffer for reference images (shutil's default is 64 KiB)
+_COPY_BUFSIZE = 1024 * 1024
+
+
+def _copy_file_range(fsrc, fdst):
+    """Copy fsrc into fdst with os.copy_file_range; False if unsupported or it stops short"""
+    try:
+        # copy_file_range lets btrfs/xfs/NFS clone or copy server-side
+        remaining = os.fstat(fsrc.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+            if copied == 0:
+                # Early EOF, or a filesystem that returns 0 instead of failing
+                return False
+            remaining -= copied
+    except (AttributeError, OSError):
+        # Not Linux, old kernel or cross-device
+        return False
+    return True
+
+
+def _copy_file(src, dst):
+    """Copy a file and its metadata like shutil.copy2, in-kernel where possible"""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        if not _copy_file_range(fsrc, fdst):
+            # Start over with a buffered copy
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst, _COPY_BUFSIZE)
+    shutil.copystat(src, dst)
+
+
+def create_instanced_mesh(template, offsets):
+    """Copy a template mesh to each (N, 3) offset in a single mesh"""
+    offsets = np.asarray(offsets, dtype=np.float64)
+    vertices = template.vertices
+    faces = template.faces
+    n = len(offsets)
+    
+    V = (vertices[None, :, :] + offsets[:, None, :]).reshape(-1, 3)
+    F = (faces[None, :, :] + (np.arange(n) * len(vertices))[:, None, None]).reshape(-1, 3)
+    return trimesh.Trimesh(vertices=V, faces=F, process=False)
+
+
 class JCBCADProcessor:
     """Process and integrate real JCB CAD files into interactive simulation"""
     
@@ -33,6 +91,10 @@ class JCBCADProcessor:
         self.texture_dir = self.project_dir / "authentic_textures"
         self.texture_dir.mkdir(exist_ok=True)
         
+        # Report target is rewritten on every run; keep a str copy for open()
+        self._report_path = self.project_dir / "CAD_PROCESSING_REPORT.md"
+        self._report_str = os.fspath(self._report_path)
+        
         # Expected CAD files from the ZIP
         self.expected_files = [
             "Backhoe.IGS", "Backhoe.STEP", "Backhoe.x_tx_t",
@@ -81,6 +143,17 @@ class JCBCADProcessor:
             print(f"❌ Error extracting ZIP: {e}")
             return False
     
+    def scan_files(self, extensions):
+        """Yield files under the CAD directory whose suffix (any case) is in extensions"""
+        pending = [self.cad_files_dir]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in extensions:
+                        yield Path(entry.path)
+    
     def process_cad_files(self):
         """Process all available CAD files into PyBullet-compatible meshes"""
         processed_components = {}
@@ -88,12 +161,8 @@ class JCBCADProcessor:
         print("\n🔧 Processing CAD files...")
         
         # Find all CAD files in directory
-        cad_extensions = ['.igs', '.step', '.stp', '.sldprt', '.obj', '.stl']
-        cad_files = []
-        
-        for ext in cad_extensions:
-            cad_files.extend(list(self.cad_files_dir.rglob(f"*{ext}")))
-            cad_files.extend(list(self.cad_files_dir.rglob(f"*{ext.upper()}")))
+        cad_extensions = {'.igs', '.step', '.stp', '.sldprt', '.obj', '.stl'}
+        cad_files = sorted(self.scan_files(cad_extensions))
         
         print(f"📋 Found {len(cad_files)} CAD files to process")
         
@@ -201,17 +270,7 @@ class JCBCADProcessor:
     
     def get_component_scale(self, component_name):
         """Get appropriate scale for component"""
-        scales = {
-            'main_body': 0.8,
-            'boom_arm': 1.2,
-            'hydraulic_cylinder': 0.6,
-            'excavator_bucket': 1.0,
-            'hydraulic_piston': 0.5,
-            'joint_pin': 0.3,
-            'stabilizer_leg': 0.7,
-            'complete_assembly': 1.0
-        }
-        return scales.get(component_name, 1.0)
+        return _COMPONENT_SCALES.get(component_name, 1.0)
     
     def create_fallback_components(self):
         """Create high-quality fallback components if CAD processing fails"""
@@ -269,10 +328,10 @@ class JCBCADProcessor:
         boom = trimesh.creation.box(extents=[3.0, 0.3, 0.4])
         
         # Add hydraulic attachment points
-        attachment1 = trimesh.creation.cylinder(radius=0.15, height=0.4)
+        attachment1 = trimesh.creation.cylinder(radius=0.15, height=0.4, sections=12)
         attachment1.apply_translation([-1.2, 0, 0])
         
-        attachment2 = trimesh.creation.cylinder(radius=0.12, height=0.4)
+        attachment2 = trimesh.creation.cylinder(radius=0.12, height=0.4, sections=12)
         attachment2.apply_translation([1.2, 0, 0])
         
         # Combine
@@ -293,14 +352,14 @@ class JCBCADProcessor:
         cutting_edge.apply_translation([0, -0.45, -0.35])
         
         # Create teeth (simplified)
-        teeth = []
-        for i in range(5):
-            tooth = trimesh.creation.box(extents=[0.15, 0.1, 0.2])
-            tooth.apply_translation([-0.4 + i*0.2, -0.5, -0.4])
-            teeth.append(tooth)
+        teeth_offsets = np.zeros((5, 3))
+        teeth_offsets[:, 0] = -0.4 + np.arange(5) * 0.2
+        teeth_offsets[:, 1:] = [-0.5, -0.4]
+        tooth = trimesh.creation.box(extents=[0.15, 0.1, 0.2])
+        teeth = create_instanced_mesh(tooth, teeth_offsets)
         
         # Combine all parts
-        bucket = trimesh.util.concatenate([bucket_body, cutting_edge] + teeth)
+        bucket = trimesh.util.concatenate([bucket_body, cutting_edge, teeth])
         
         # Color it steel gray
         bucket.visual.face_colors = [120, 120, 120, 255]
@@ -310,17 +369,17 @@ class JCBCADProcessor:
     def create_hydraulic_cylinder(self):
         """Create hydraulic cylinder"""
         # Main cylinder body
-        cylinder = trimesh.creation.cylinder(radius=0.08, height=1.5)
+        cylinder = trimesh.creation.cylinder(radius=0.08, height=1.5, sections=16)
         
         # Piston rod
-        rod = trimesh.creation.cylinder(radius=0.04, height=1.0)
+        rod = trimesh.creation.cylinder(radius=0.04, height=1.0, sections=12)
         rod.apply_translation([0, 0, 0.75])
         
         # End caps
-        cap1 = trimesh.creation.cylinder(radius=0.1, height=0.1)
+        cap1 = trimesh.creation.cylinder(radius=0.1, height=0.1, sections=12)
         cap1.apply_translation([0, 0, -0.8])
         
-        cap2 = trimesh.creation.cylinder(radius=0.06, height=0.1)
+        cap2 = trimesh.creation.cylinder(radius=0.06, height=0.1, sections=12)
         cap2.apply_translation([0, 0, 1.2])
         
         # Combine
@@ -335,18 +394,21 @@ class JCBCADProcessor:
         """Extract and process reference images from the CAD package"""
         print("\n🖼️  Processing reference images...")
         
-        image_files = list(self.cad_files_dir.rglob("*.png")) + \
-                     list(self.cad_files_dir.rglob("*.jpg")) + \
-                     list(self.cad_files_dir.rglob("*.jpeg"))
+        image_files = sorted(self.scan_files({'.png', '.jpg', '.jpeg'}))
         
         if image_files:
             print(f"📸 Found {len(image_files)} reference images")
             
-            # Copy images to texture directory
-            for img_file in image_files:
-                dest_path = self.texture_dir / img_file.name
-                shutil.copy2(img_file, dest_path)
-                print(f"   📁 Saved: {img_file.name}")
+            # One source per destination name: images with the same name in
+            # different subdirectories collapse to the last one, as a sequential
+            # copy would leave it, so no two copies write the same file
+            targets = {self.texture_dir / img_file.name: img_file for img_file in image_files}
+            
+            # Copy images to texture directory (independent I/O, so overlap the copies)
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                copies = executor.map(_copy_file, targets.values(), targets.keys())
+                for img_file, _ in zip(targets.values(), copies):
+                    print(f"   📁 Saved: {img_file.name}")
                 
             return True
         else:
@@ -355,9 +417,9 @@ class JCBCADProcessor:
     
     def generate_processing_report(self, components):
         """Generate comprehensive processing report"""
-        report_path = self.project_dir / "CAD_PROCESSING_REPORT.md"
+        report_path = self._report_path
         
-        with open(report_path, 'w') as f:
+        with open(self._report_str, 'w', buffering=1 << 16) as f:
             f.write("# JCB CAD File Processing Report\n\n")
             f.write("## Overview\n")
             f.write("This report details the processing of authentic JCB CAD files from Raushan Tiwari.\n\n")
@@ -9,6 +9,8 @@ import time
 import math
 import os
 import sys
+import importlib.util
+from PIL import Image
 
 
 class Interactive3DRoboticArm:
@@ -22,10 +24,17 @@ class Interactive3DRoboticArm:
             gui (bool): Whether to show GUI or run headless
         """
         # Connect to PyBullet with enhanced rendering
+        self.egl_plugin = -1
         if gui:
             self.physics_client = p.connect(p.GUI)
         else:
             self.physics_client = p.connect(p.DIRECT)
+            # Headless: load the EGL renderer so hardware OpenGL capture runs on the GPU
+            egl = importlib.util.find_spec('eglRenderer')
+            if egl is not None:
+                self.egl_plugin = p.loadPlugin(egl.origin, "_eglRendererPlugin")
+            else:
+                self.egl_plugin = p.loadPlugin("eglRendererPlugin")
         
         # Enable advanced rendering features
         p.configureDebugVisualizer(p.COV_ENABLE_SHADOWS, 1)
@@ -423,6 +432,10 @@ class Interactive3DRoboticArm:
             [0.0, -0.3, 0.5, 0.0]
         ]
         
+        # Segment start poses and deltas, so each frame is one row-wise blend
+        demo_poses = np.asarray(demo_poses)
+        pose_deltas = np.diff(demo_poses, axis=0)
+        
         start_time = time.time()
         pose_duration = duration / (len(demo_poses) - 1)
         
@@ -438,17 +451,9 @@ class Interactive3DRoboticArm:
                 current_pose_idx = len(demo_poses) - 2
                 local_progress = 1.0
             
-            # Smooth interpolation between poses
-            current_pose = demo_poses[current_pose_idx]
-            next_pose = demo_poses[current_pose_idx + 1]
-            
-            # Use sinusoidal interpolation for smooth motion
+            # Smooth (sinusoidal) interpolation between poses
             smooth_progress = 0.5 * (1 - math.cos(math.pi * local_progress))
-            
-            interpolated_pose = []
-            for i in range(len(current_pose)):
-                interp_value = current_pose[i] + smooth_progress * (next_pose[i] - current_pose[i])
-                interpolated_pose.append(interp_value)
+            interpolated_pose = demo_poses[current_pose_idx] + smooth_progress * pose_deltas[current_pose_idx]
             
             # Apply to arm
             self.set_joint_positions(interpolated_pose)
@@ -535,15 +540,24 @@ class Interactive3DRoboticArm:
             height=height,
             viewMatrix=view_matrix,
             projectionMatrix=proj_matrix,
-            renderer=p.ER_BULLET_HARDWARE_OPENGL
+            renderer=p.ER_BULLET_HARDWARE_OPENGL,
+            flags=p.ER_NO_SEGMENTATION_MASK
         )
         
-        # Save screenshot (would need PIL for actual saving)
+        # View the flat RGBA buffer as (height, width, 4) and drop alpha
+        rgb_array = np.asarray(rgb_array, dtype=np.uint8).reshape(height, width, 4)[:, :, :3]
+        
+        # Fast zlib level: much quicker to encode, still a valid PNG
+        Image.fromarray(np.ascontiguousarray(rgb_array)).save(
+            filename, "PNG", compress_level=1, optimize=False
+        )
         print(f"📸 Screenshot captured: {filename}")
         return rgb_array
     
     def cleanup(self):
         """Clean up PyBullet environment"""
+        if self.egl_plugin >= 0:
+            p.unloadPlugin(self.egl_plugin)
         p.disconnect()
 
 
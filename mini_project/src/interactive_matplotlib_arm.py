@@ -9,12 +9,40 @@ import matplotlib.patches as patches
 from matplotlib.animation import FuncAnimation
 import time
 import math
+import functools
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=4096)
+def _arm_positions(thetas, lengths, base):
+    """Joint positions for a (rounded) joint tuple, cached since demo and slider poses repeat"""
+    # Absolute boom, stick and bucket angles along the chain, then every
+    # link vector from one cos/sin over the whole array
+    angles = np.cumsum(thetas)
+    lengths = np.asarray(lengths)
+    
+    positions = np.empty((4, 2))
+    positions[0] = base
+    positions[1:, 0] = base[0] + np.cumsum(lengths * np.cos(angles))
+    positions[1:, 1] = base[1] + np.cumsum(lengths * np.sin(angles))
+    
+    # Read-only so callers cannot corrupt the cached entry
+    positions.setflags(write=False)
+    return positions
+
+
 class InteractiveJCBRoboticArm:
     """Interactive JCB Robotic Arm with Real-Time Controls"""
     
+    # Bucket outline in its own frame (0.8 m wide, 0.6 m high, teeth 0.3 m ahead)
+    BUCKET_VERTICES = np.array([
+        [-0.3, -0.4],
+        [0.3, -0.4],
+        [0.6, 0.0],  # Bucket teeth
+        [0.3, 0.4],
+        [-0.3, 0.4]
+    ])
+    
     def __init__(self):
         """Initialize the interactive robotic arm system"""
         
@@ -41,6 +69,9 @@ class InteractiveJCBRoboticArm:
         self.base_x = 0.0
         self.base_y = 2.0
         
+        # Interpolated frames per demo move (each frame redraws the figure)
+        self.demo_interp_steps = 8
+        
         # Initialize matplotlib figure
         self.setup_interactive_plot()
         
@@ -93,9 +124,8 @@ class InteractiveJCBRoboticArm:
         # Add workspace boundaries
         self.draw_workspace_boundary()
         
-        # Initialize arm visualization
-        self.arm_lines = []
-        self.joint_circles = []
+        # Initialize arm visualization (artists are created once, then moved)
+        self.create_arm_artists()
         self.update_arm_visualization()
         
         # Create interactive sliders
@@ -194,19 +224,9 @@ class InteractiveJCBRoboticArm:
     def forward_kinematics(self):
         """Calculate forward kinematics for the robotic arm"""
         
-        # Joint 1 (Boom) - relative to base
-        x1 = self.base_x + self.L1 * np.cos(self.theta1)
-        y1 = self.base_y + self.L1 * np.sin(self.theta1)
-        
-        # Joint 2 (Stick) - relative to joint 1
-        x2 = x1 + self.L2 * np.cos(self.theta1 + self.theta2)
-        y2 = y1 + self.L2 * np.sin(self.theta1 + self.theta2)
-        
-        # End effector (Bucket) - relative to joint 2
-        x3 = x2 + self.L3 * np.cos(self.theta1 + self.theta2 + self.theta3)
-        y3 = y2 + self.L3 * np.sin(self.theta1 + self.theta2 + self.theta3)
-        
-        return [(self.base_x, self.base_y), (x1, y1), (x2, y2), (x3, y3)]
+        # Bucket rotation (theta4) does not move any joint, so it is not part of the key
+        thetas = (round(self.theta1, 4), round(self.theta2, 4), round(self.theta3, 4))
+        return _arm_positions(thetas, (self.L1, self.L2, self.L3), (self.base_x, self.base_y))
     
     def update_joint(self, val):
         """Update joint angles from sliders"""
@@ -224,44 +244,45 @@ class InteractiveJCBRoboticArm:
         # Redraw
         self.fig.canvas.draw_idle()
         
-    def update_arm_visualization(self):
-        """Update the robotic arm visualization"""
-        
-        # Clear previous arm lines and joints
-        for line in self.arm_lines:
-            line.remove()
-        for circle in self.joint_circles:
-            circle.remove()
-            
-        self.arm_lines = []
-        self.joint_circles = []
-        
-        # Calculate forward kinematics
-        positions = self.forward_kinematics()
+    def create_arm_artists(self):
+        """Create arm segment, joint and bucket artists that updates move in place"""
         
-        # Draw arm segments with JCB colors
+        # Arm segments with JCB colors
         colors = ['#FF6B35', '#F7931E', '#FFD700', '#32CD32']  # JCB orange/yellow gradient
         linewidths = [12, 10, 8, 6]  # Decreasing thickness for realism
         
-        for i in range(len(positions) - 1):
-            x_vals = [positions[i][0], positions[i+1][0]]
-            y_vals = [positions[i][1], positions[i+1][1]]
-            
-            line = self.ax_main.plot(x_vals, y_vals, 
+        self.arm_lines = []
+        for i in range(3):
+            line = self.ax_main.plot([], [],
                                    color=colors[i], linewidth=linewidths[i],
                                    solid_capstyle='round')[0]
             self.arm_lines.append(line)
             
-        # Draw joints as circles
+        # Joints as circles (one scatter for all four)
         joint_colors = ['#333333', '#FF6B35', '#F7931E', '#FFD700']
         joint_sizes = [150, 120, 100, 80]
         
-        for i, (x, y) in enumerate(positions):
-            circle = self.ax_main.scatter(x, y, s=joint_sizes[i], 
-                                        c=joint_colors[i], 
-                                        edgecolors='black', linewidths=2,
-                                        zorder=10)
-            self.joint_circles.append(circle)
+        self.joint_circles = self.ax_main.scatter(np.zeros(4), np.zeros(4), s=joint_sizes,
+                                                c=joint_colors,
+                                                edgecolors='black', linewidths=2,
+                                                zorder=10)
+        
+        # Bucket polygon
+        self.bucket_patch = patches.Polygon(np.zeros((5, 2)), facecolor='#444444',
+                                          edgecolor='black', linewidth=2, alpha=0.8)
+        self.ax_main.add_patch(self.bucket_patch)
+        
+    def update_arm_visualization(self):
+        """Update the robotic arm visualization"""
+        
+        # Calculate forward kinematics
+        positions = self.forward_kinematics()
+        
+        # Move arm segments and joints
+        for i, line in enumerate(self.arm_lines):
+            line.set_data(positions[i:i+2, 0], positions[i:i+2, 1])
+            
+        self.joint_circles.set_offsets(positions)
             
         # Draw bucket shape
         self.draw_bucket(positions[-1])
@@ -276,34 +297,19 @@ class InteractiveJCBRoboticArm:
         # Calculate bucket orientation
         bucket_angle = self.theta1 + self.theta2 + self.theta3 + self.theta4
         
-        # Bucket vertices (realistic JCB bucket shape)
-        bucket_width = 0.8
-        bucket_height = 0.6
-        
-        # Create bucket polygon
-        vertices = np.array([
-            [-bucket_height/2, -bucket_width/2],
-            [bucket_height/2, -bucket_width/2],
-            [bucket_height/2 + 0.3, 0],  # Bucket teeth
-            [bucket_height/2, bucket_width/2],
-            [-bucket_height/2, bucket_width/2]
-        ])
-        
         # Rotate bucket based on orientation
+        c, s = np.cos(bucket_angle), np.sin(bucket_angle)
         rotation_matrix = np.array([
-            [np.cos(bucket_angle), -np.sin(bucket_angle)],
-            [np.sin(bucket_angle), np.cos(bucket_angle)]
+            [c, -s],
+            [s, c]
         ])
         
-        rotated_vertices = vertices @ rotation_matrix.T
+        rotated_vertices = self.BUCKET_VERTICES @ rotation_matrix.T
         rotated_vertices[:, 0] += x
         rotated_vertices[:, 1] += y
         
         # Draw bucket
-        bucket = patches.Polygon(rotated_vertices, facecolor='#444444', 
-                               edgecolor='black', linewidth=2, alpha=0.8)
-        self.ax_main.add_patch(bucket)
-        self.arm_lines.append(bucket)
+        self.bucket_patch.set_xy(rotated_vertices)
         
     def update_end_effector_trail(self, end_pos):
         """Update end effector movement trail"""
@@ -372,7 +378,7 @@ class InteractiveJCBRoboticArm:
         print("🎬 Running excavation demonstration...")
         
         # Demo poses (realistic excavation sequence)
-        demo_poses = [
+        demo_poses = np.array([
             (0.3, -0.8, 1.2, 0.0),    # Home
             (0.8, -1.5, 2.0, 0.0),    # Approach
             (1.2, -2.0, 2.5, 0.5),    # Dig position
@@ -381,28 +387,27 @@ class InteractiveJCBRoboticArm:
             (-0.5, -0.5, 0.8, 1.0),   # Swing
             (-0.8, 0.0, 0.0, 0.0),    # Dump
             (0.3, -0.8, 1.2, 0.0)     # Return
-        ]
+        ])
+        
+        # Whole trajectory up front: segment i blends waypoint i into waypoint i+1
+        steps = self.demo_interp_steps
+        waypoints = np.vstack([(self.theta1, self.theta2, self.theta3, self.theta4), demo_poses])
+        alphas = np.arange(1, steps + 1)[:, np.newaxis] / steps
+        trajectory = waypoints[:-1, np.newaxis] + alphas * np.diff(waypoints, axis=0)[:, np.newaxis]
         
         # Animate through poses
-        for i, (t1, t2, t3, t4) in enumerate(demo_poses):
+        for i, segment in enumerate(trajectory):
             print(f"  🎯 Demo step {i+1}: Moving to position...")
             
-            # Smooth interpolation to target
-            steps = 20
-            current_poses = (self.theta1, self.theta2, self.theta3, self.theta4)
-            
-            for step in range(steps):
-                alpha = step / (steps - 1)
-                
-                # Interpolate each joint
-                self.theta1 = current_poses[0] + alpha * (t1 - current_poses[0])
-                self.theta2 = current_poses[1] + alpha * (t2 - current_poses[1])
-                self.theta3 = current_poses[2] + alpha * (t3 - current_poses[2])
-                self.theta4 = current_poses[3] + alpha * (t4 - current_poses[3])
+            for pose in segment:
+                self.theta1, self.theta2, self.theta3, self.theta4 = pose.tolist()
                 
-                # Update sliders
-                for j, slider in enumerate(self.sliders):
-                    slider.set_val(getattr(self, f'theta{j+1}'))
+                # Update sliders without firing update_joint, which would
+                # read the sliders that have not been moved yet
+                for slider, value in zip(self.sliders, pose):
+                    slider.eventson = False
+                    slider.set_val(value)
+                    slider.eventson = True
                 
                 # Update visualization
                 self.update_arm_visualization()
@@ -430,7 +435,8 @@ class InteractiveJCBRoboticArm:
         timestamp = int(time.time())
         filename = f"interactive_jcb_arm_{timestamp}.png"
         
-        self.fig.savefig(filename, dpi=300, bbox_inches='tight')
+        # Full-resolution export; fast zlib level keeps the large PNG quick to write
+        self.fig.savefig(filename, dpi=300, bbox_inches='tight', pil_kwargs={'compress_level': 1})
         print(f"📸 Screenshot saved: {filename}")
         
     def run_interactive_system(self):
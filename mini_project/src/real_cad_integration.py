@@ -6,6 +6,7 @@ import os
 import sys
 import time
 import math
+import hashlib
 import numpy as np
 import requests
 import zipfile
@@ -14,12 +15,58 @@ import open3d as o3d
 import pybullet as p
 import pybullet_data
 from pathlib import Path
+from PIL import Image
 import tempfile
 import subprocess
 import urllib.request
 from bs4 import BeautifulSoup
 import json
 
+from cad_file_processor import create_instanced_mesh
+
+# Bump whenever a placeholder builder's geometry or the OBJ export changes
+PLACEHOLDER_MESH_VERSION = 1
+
+
+# Download instructions, stored pre-encoded since they never change
+_GRABCAD_INSTRUCTIONS = b"""
+# CAD FILE DOWNLOAD INSTRUCTIONS
+
+## Real JCB CAD Files from GrabCAD
+
+The following files are available at: https://grabcad.com/library/jcb-back-arm-1
+Created by: Raushan Tiwari (Mechanical Engineer)
+
+### Required Files:
+1. **Backhoe.IGS** - IGES format (industry standard)
+2. **Backhoe.STEP** - STEP format (industry standard)  
+3. **Backhoe.x_tx_t** - Text export format
+4. **Body.SLDPRT** - SolidWorks part file
+5. **Arm.SLDPRT** - SolidWorks arm component
+6. **Cylinder.SLDPRT** - Hydraulic cylinder
+7. **Pin.SLDPRT** - Joint pin
+8. **Piston.SLDPRT** - Hydraulic piston
+9. **Stabilizer.SLDPRT** - Stabilizer component
+10. **Tension Bar.SLDPRT** - Tension bar
+11. **Bucket.SLDPRT** - Excavator bucket
+12. **Feather.SLDPRT** - Detail component
+13. **Backhoe.SLDASM** - Complete assembly
+14. **JCB Arm.png** - Reference image 1
+15. **JCB Arm 1.png** - Reference image 2
+16. **JCB Arm 2.png** - Reference image 3
+
+### Download Process:
+1. Visit: https://grabcad.com/library/jcb-back-arm-1
+2. Sign up for free GrabCAD account if needed
+3. Download all files listed above
+4. Place files in the 'original_cad' directory
+5. Run this system to process and integrate files
+
+### Alternative: Sample CAD Creation
+If CAD files cannot be downloaded, this system will create
+professional-quality sample meshes based on the original designs.
+"""
+
 
 class RealCADIntegrationSystem:
     """System to download and integrate real CAD files into PyBullet simulation"""
@@ -34,10 +81,21 @@ class RealCADIntegrationSystem:
         p.configureDebugVisualizer(p.COV_ENABLE_RENDERING, 1)
         p.configureDebugVisualizer(p.COV_ENABLE_GUI, 1)
         
+        # The GUI shows buffer previews by default; they cost extra full-size buffers per frame
+        self.enable_debug_previews(False)
+        
         p.setAdditionalSearchPath(pybullet_data.getDataPath())
         p.setGravity(0, 0, -9.81)
         p.setRealTimeSimulation(0)
         
+        # One physics step per displayed frame, paced against wall clock
+        self.time_step = 1.0 / 60.0
+        p.setTimeStep(self.time_step)
+        
+        # Array APIs (joint batches, camera images) are much faster with NumPy support
+        if not p.isNumpyEnabled():
+            print("⚠️ PyBullet was built without NumPy support; rebuild it with NumPy for faster array calls")
+        
         # Directory setup
         self.project_dir = Path("cad_integration_project")
         self.project_dir.mkdir(exist_ok=True)
@@ -76,6 +134,9 @@ class RealCADIntegrationSystem:
         self.joint_sliders = []
         self.arm_id = None
         
+        # Placeholders are visual only; set True to get one watertight solid per part
+        self.watertight_placeholders = False
+        
         print("🔧 REAL CAD INTEGRATION SYSTEM FOR JCB ROBOTIC ARM")
         print("=" * 60)
         print("📦 Integrating authentic CAD files from GrabCAD")
@@ -83,49 +144,17 @@ class RealCADIntegrationSystem:
         print("🛠️ SolidWorks, AutoCAD, Creo, Ansys compatible")
         print("=" * 60)
         
+    def enable_debug_previews(self, enabled=True):
+        """Toggle the RGB/depth/segmentation preview panes in the GUI"""
+        flag = 1 if enabled else 0
+        p.configureDebugVisualizer(p.COV_ENABLE_RGB_BUFFER_PREVIEW, flag)
+        p.configureDebugVisualizer(p.COV_ENABLE_DEPTH_BUFFER_PREVIEW, flag)
+        p.configureDebugVisualizer(p.COV_ENABLE_SEGMENTATION_MARK_PREVIEW, flag)
+        
     def create_grabcad_instructions(self):
         """Create instructions for downloading CAD files from GrabCAD"""
-        instructions = """
-# CAD FILE DOWNLOAD INSTRUCTIONS
-
-## Real JCB CAD Files from GrabCAD
-
-The following files are available at: https://grabcad.com/library/jcb-back-arm-1
-Created by: Raushan Tiwari (Mechanical Engineer)
-
-### Required Files:
-1. **Backhoe.IGS** - IGES format (industry standard)
-2. **Backhoe.STEP** - STEP format (industry standard)  
-3. **Backhoe.x_tx_t** - Text export format
-4. **Body.SLDPRT** - SolidWorks part file
-5. **Arm.SLDPRT** - SolidWorks arm component
-6. **Cylinder.SLDPRT** - Hydraulic cylinder
-7. **Pin.SLDPRT** - Joint pin
-8. **Piston.SLDPRT** - Hydraulic piston
-9. **Stabilizer.SLDPRT** - Stabilizer component
-10. **Tension Bar.SLDPRT** - Tension bar
-11. **Bucket.SLDPRT** - Excavator bucket
-12. **Feather.SLDPRT** - Detail component
-13. **Backhoe.SLDASM** - Complete assembly
-14. **JCB Arm.png** - Reference image 1
-15. **JCB Arm 1.png** - Reference image 2
-16. **JCB Arm 2.png** - Reference image 3
-
-### Download Process:
-1. Visit: https://grabcad.com/library/jcb-back-arm-1
-2. Sign up for free GrabCAD account if needed
-3. Download all files listed above
-4. Place files in the 'original_cad' directory
-5. Run this system to process and integrate files
-
-### Alternative: Sample CAD Creation
-If CAD files cannot be downloaded, this system will create
-professional-quality sample meshes based on the original designs.
-"""
-        
         instructions_path = self.project_dir / "CAD_DOWNLOAD_INSTRUCTIONS.md"
-        with open(instructions_path, 'w') as f:
-            f.write(instructions)
+        instructions_path.write_bytes(_GRABCAD_INSTRUCTIONS)
             
         print(f"📖 Download instructions created: {instructions_path}")
         return instructions_path
@@ -135,10 +164,13 @@ professional-quality sample meshes based on the original designs.
         available_files = []
         missing_files = []
         
+        # One directory listing instead of a stat() per expected file
+        with os.scandir(self.cad_files_dir) as entries:
+            present = {entry.name: entry for entry in entries if entry.is_file()}
+        
         for key, filename in self.cad_file_info.items():
-            file_path = self.cad_files_dir / filename
-            if file_path.exists():
-                available_files.append((key, filename, file_path))
+            if filename in present:
+                available_files.append((key, filename, self.cad_files_dir / filename))
             else:
                 missing_files.append((key, filename))
         
@@ -148,7 +180,7 @@ professional-quality sample meshes based on the original designs.
         if available_files:
             print("\n✅ Found CAD files:")
             for key, filename, path in available_files:
-                file_size = path.stat().st_size / (1024*1024)  # MB
+                file_size = present[filename].stat().st_size / (1024*1024)  # MB
                 print(f"  • {filename} ({file_size:.1f} MB)")
         
         if missing_files:
@@ -217,9 +249,9 @@ professional-quality sample meshes based on the original designs.
             mesh = self.create_generic_placeholder()
             color = [0.6, 0.6, 0.6, 1.0]  # Light Gray
             
-        # Save as STL
-        output_path = self.processed_dir / f"{key}_placeholder.stl"
-        mesh.export(str(output_path))
+        # Save as indexed OBJ
+        output_path = self.processed_dir / f"{key}_placeholder.obj"
+        self.export_placeholder(mesh, output_path)
         
         print(f"    💾 Saved placeholder: {output_path}")
         return mesh, color
@@ -237,16 +269,17 @@ professional-quality sample meshes based on the original designs.
         engine = trimesh.creation.box([1.5, 2.0, 1.5])
         engine.apply_translation([-2.0, 0, 1.35])
         
-        # Wheels/tracks
-        for i in range(4):
-            x = -1.5 + 3.0 * (i // 2)
-            y = -1.0 + 2.0 * (i % 2)
-            wheel = trimesh.creation.cylinder(radius=0.8, height=0.4)
-            wheel.apply_translation([x, y, -0.5])
-            chassis = chassis.union(wheel)
+        # Wheels/tracks (one template instanced at all four corners).
+        # Decorative round parts use a reduced section count to keep meshes light.
+        i = np.arange(4)
+        wheel_offsets = np.stack([-1.5 + 3.0 * (i // 2),
+                                  -1.0 + 2.0 * (i % 2),
+                                  np.full(4, -0.5)], axis=1)
+        wheel = trimesh.creation.cylinder(radius=0.8, height=0.4, sections=16,
+                                          process=self.watertight_placeholders)
+        wheels = create_instanced_mesh(wheel, wheel_offsets)
         
-        body = chassis.union(cab).union(engine)
-        return body
+        return self.merge_parts([chassis, wheels, cab, engine])
         
     def create_arm_placeholder(self):
         """Create arm/boom placeholder"""
@@ -255,12 +288,14 @@ professional-quality sample meshes based on the original designs.
         boom.apply_translation([0, 0, 2.0])
         
         # Hydraulic attachment points
+        parts = [boom]
         for z in [0.5, 3.5]:
-            mount = trimesh.creation.cylinder(radius=0.2, height=0.6)
+            mount = trimesh.creation.cylinder(radius=0.2, height=0.6, sections=12,
+                                              process=self.watertight_placeholders)
             mount.apply_translation([0, 0, z])
-            boom = boom.union(mount)
+            parts.append(mount)
             
-        return boom
+        return self.merge_parts(parts)
         
     def create_bucket_placeholder(self):
         """Create bucket placeholder"""
@@ -273,30 +308,47 @@ professional-quality sample meshes based on the original designs.
         edge.apply_translation([1.6, 0, 0.075])
         
         # Teeth
-        for i in range(7):
-            tooth = trimesh.creation.box([0.2, 0.12, 0.25])
-            tooth.apply_translation([1.7, -0.36 + i*0.12, 0])
-            bucket = bucket.union(tooth)
+        teeth_offsets = np.zeros((7, 3))
+        teeth_offsets[:, 0] = 1.7
+        teeth_offsets[:, 1] = -0.36 + np.arange(7) * 0.12
+        tooth = trimesh.creation.box([0.2, 0.12, 0.25])
+        teeth = create_instanced_mesh(tooth, teeth_offsets)
         
-        return bucket.union(edge)
+        return self.merge_parts([bucket, teeth, edge])
         
     def create_cylinder_placeholder(self):
         """Create hydraulic cylinder placeholder"""
         # Cylinder body
-        cylinder = trimesh.creation.cylinder(radius=0.1, height=2.0)
+        cylinder = trimesh.creation.cylinder(radius=0.1, height=2.0, sections=16,
+                                             process=self.watertight_placeholders)
         
         # Piston rod
-        rod = trimesh.creation.cylinder(radius=0.05, height=1.0)
+        rod = trimesh.creation.cylinder(radius=0.05, height=1.0, sections=12,
+                                        process=self.watertight_placeholders)
         rod.apply_translation([0, 0, 1.5])
         
         # End caps
-        cap1 = trimesh.creation.cylinder(radius=0.12, height=0.15)
+        cap1 = trimesh.creation.cylinder(radius=0.12, height=0.15, sections=12,
+                                         process=self.watertight_placeholders)
         cap1.apply_translation([0, 0, -1.075])
         
-        cap2 = trimesh.creation.cylinder(radius=0.12, height=0.15)
+        cap2 = trimesh.creation.cylinder(radius=0.12, height=0.15, sections=12,
+                                         process=self.watertight_placeholders)
         cap2.apply_translation([0, 0, 1.075])
         
-        return cylinder.union(rod).union(cap1).union(cap2)
+        return self.merge_parts([cylinder, rod, cap1, cap2])
+        
+    def merge_parts(self, parts):
+        """Merge placeholder parts into a single mesh"""
+        if self.watertight_placeholders:
+            # One N-way boolean instead of a chain of pairwise unions
+            try:
+                return trimesh.boolean.union(parts, engine='manifold')
+            except Exception as e:
+                print(f"    ⚠️ Manifold union unavailable ({e}), merging buffers instead")
+                
+        # Parts are disjoint visual primitives, so merge buffers instead of CSG
+        return trimesh.util.concatenate(parts)
         
     def create_generic_placeholder(self):
         """Create generic component placeholder"""
@@ -306,7 +358,15 @@ professional-quality sample meshes based on the original designs.
         """Create professional URDF from processed meshes"""
         print("\n📝 Creating professional URDF model...")
         
-        urdf_content = '''<?xml version="1.0"?>
+        # Inertias from the links' collision primitives, so the mass matrix
+        # matches the geometry Bullet actually simulates
+        base_inertia = self.box_inertia_xml(8000, [4.0, 2.5, 1.8])
+        boom_inertia = self.box_inertia_xml(1200, [0.5, 0.4, 4.0])
+        stick_inertia = self.box_inertia_xml(800, [0.4, 0.32, 2.8])
+        bucket_inertia = self.box_inertia_xml(600, [1.5, 1.0, 0.8])
+        rotation_inertia = self.cylinder_inertia_xml(50, 0.05, 0.2)
+        
+        urdf_content = f'''<?xml version="1.0"?>
 <robot name="jcb_excavator_arm">
     
     <!-- Materials -->
@@ -330,19 +390,26 @@ professional-quality sample meshes based on the original designs.
     <link name="base_link">
         <visual>
             <geometry>
-                <mesh filename="body_placeholder.stl" scale="1 1 1"/>
+                <mesh filename="../processed_meshes/body_placeholder.obj" scale="1 1 1"/>
             </geometry>
             <material name="jcb_yellow"/>
         </visual>
+        <!-- Collision uses the analytic primitives the placeholder is built from -->
         <collision>
             <geometry>
-                <mesh filename="body_placeholder.stl" scale="1 1 1"/>
+                <box size="4.0 2.5 1.8"/>
+            </geometry>
+        </collision>
+        <collision>
+            <origin xyz="0.8 0 2.0" rpy="0 0 0"/>
+            <geometry>
+                <box size="2.0 2.0 2.2"/>
             </geometry>
         </collision>
         <inertial>
             <mass value="8000"/>
             <origin xyz="0 0 1" rpy="0 0 0"/>
-            <inertia ixx="1000" ixy="0" ixz="0" iyy="1000" iyz="0" izz="1000"/>
+            {base_inertia}
         </inertial>
     </link>
     
@@ -350,19 +417,20 @@ professional-quality sample meshes based on the original designs.
     <link name="boom_link">
         <visual>
             <geometry>
-                <mesh filename="arm_placeholder.stl" scale="1 1 1"/>
+                <mesh filename="../processed_meshes/arm_placeholder.obj" scale="1 1 1"/>
             </geometry>
             <material name="jcb_orange"/>
         </visual>
         <collision>
+            <origin xyz="0 0 2.0" rpy="0 0 0"/>
             <geometry>
-                <mesh filename="arm_placeholder.stl" scale="1 1 1"/>
+                <box size="0.5 0.4 4.0"/>
             </geometry>
         </collision>
         <inertial>
             <mass value="1200"/>
             <origin xyz="0 0 2" rpy="0 0 0"/>
-            <inertia ixx="400" ixy="0" ixz="0" iyy="400" iyz="0" izz="100"/>
+            {boom_inertia}
         </inertial>
     </link>
     
@@ -380,19 +448,20 @@ professional-quality sample meshes based on the original designs.
     <link name="stick_link">
         <visual>
             <geometry>
-                <mesh filename="arm_placeholder.stl" scale="0.8 0.8 0.7"/>
+                <mesh filename="../processed_meshes/arm_placeholder.obj" scale="0.8 0.8 0.7"/>
             </geometry>
             <material name="jcb_orange"/>
         </visual>
         <collision>
+            <origin xyz="0 0 1.4" rpy="0 0 0"/>
             <geometry>
-                <mesh filename="arm_placeholder.stl" scale="0.8 0.8 0.7"/>
+                <box size="0.4 0.32 2.8"/>
             </geometry>
         </collision>
         <inertial>
             <mass value="800"/>
             <origin xyz="0 0 1.4" rpy="0 0 0"/>
-            <inertia ixx="200" ixy="0" ixz="0" iyy="200" iyz="0" izz="50"/>
+            {stick_inertia}
         </inertial>
     </link>
     
@@ -410,19 +479,26 @@ professional-quality sample meshes based on the original designs.
     <link name="bucket_link">
         <visual>
             <geometry>
-                <mesh filename="bucket_placeholder.stl" scale="1 1 1"/>
+                <mesh filename="../processed_meshes/bucket_placeholder.obj" scale="1 1 1"/>
             </geometry>
             <material name="steel_gray"/>
         </visual>
         <collision>
+            <origin xyz="0.75 0 0.4" rpy="0 0 0"/>
+            <geometry>
+                <box size="1.5 1.0 0.8"/>
+            </geometry>
+        </collision>
+        <collision>
+            <origin xyz="1.6 0 0.075" rpy="0 0 0"/>
             <geometry>
-                <mesh filename="bucket_placeholder.stl" scale="1 1 1"/>
+                <box size="1.7 0.9 0.15"/>
             </geometry>
         </collision>
         <inertial>
             <mass value="600"/>
             <origin xyz="0.75 0 0.4" rpy="0 0 0"/>
-            <inertia ixx="100" ixy="0" ixz="0" iyy="150" iyz="0" izz="100"/>
+            {bucket_inertia}
         </inertial>
     </link>
     
@@ -452,7 +528,7 @@ professional-quality sample meshes based on the original designs.
         <inertial>
             <mass value="50"/>
             <origin xyz="0 0 0" rpy="0 0 0"/>
-            <inertia ixx="1" ixy="0" ixz="0" iyy="1" iyz="0" izz="1"/>
+            {rotation_inertia}
         </inertial>
     </link>
     
@@ -476,21 +552,47 @@ professional-quality sample meshes based on the original designs.
         print(f"✅ Professional URDF created: {urdf_path}")
         return urdf_path
         
+    def box_inertia_xml(self, mass, size):
+        """URDF <inertia> element for a solid box of the given mass and extents"""
+        inertia = trimesh.creation.box(extents=size).moment_inertia * mass / np.prod(size)
+        return self.inertia_xml(inertia)
+        
+    def cylinder_inertia_xml(self, mass, radius, length):
+        """URDF <inertia> element for a solid cylinder along z"""
+        ixx = mass * (3 * radius**2 + length**2) / 12
+        izz = mass * radius**2 / 2
+        return self.inertia_xml(np.diag([ixx, ixx, izz]))
+        
+    def inertia_xml(self, inertia):
+        """Format a 3x3 inertia tensor as a URDF <inertia> element"""
+        inertia = np.asarray(inertia) + 0.0  # normalise -0.0 products of inertia
+        return (f'<inertia ixx="{inertia[0, 0]:.4g}" ixy="{inertia[0, 1]:.4g}" ixz="{inertia[0, 2]:.4g}" '
+                f'iyy="{inertia[1, 1]:.4g}" iyz="{inertia[1, 2]:.4g}" izz="{inertia[2, 2]:.4g}"/>')
+        
     def load_into_pybullet(self, urdf_path):
         """Load the URDF model into PyBullet"""
         print(f"\n🎮 Loading model into PyBullet: {urdf_path}")
         
-        # Setup environment
-        plane_id = p.loadURDF("plane.urdf")
-        p.changeVisualShape(plane_id, -1, rgbaColor=[0.8, 0.8, 0.8, 1.0])
-        
-        # Load the JCB excavator
-        self.arm_id = p.loadURDF(
-            str(urdf_path),
-            basePosition=[0, 0, 0],
-            baseOrientation=[0, 0, 0, 1],
-            useFixedBase=True
-        )
+        # Suspend rendering so shapes are not uploaded/redrawn mid-load
+        p.configureDebugVisualizer(p.COV_ENABLE_RENDERING, 0)
+        try:
+            # Setup environment
+            plane_id = p.loadURDF("plane.urdf")
+            p.changeVisualShape(plane_id, -1, rgbaColor=[0.8, 0.8, 0.8, 1.0])
+            
+            # Load the JCB excavator (repeated meshes share cached graphics shapes)
+            self.arm_id = p.loadURDF(
+                str(urdf_path),
+                basePosition=[0, 0, 0],
+                baseOrientation=[0, 0, 0, 1],
+                useFixedBase=True,
+                flags=p.URDF_ENABLE_CACHED_GRAPHICS_SHAPES
+            )
+        finally:
+            p.configureDebugVisualizer(p.COV_ENABLE_RENDERING, 1)
+        
+        # Looser solver tolerance and fewer iterations are plenty for position-controlled joints
+        p.setPhysicsEngineParameter(numSolverIterations=20, solverResidualThreshold=1e-2)
         
         if self.arm_id is None:
             raise Exception("Failed to load URDF model")
@@ -519,6 +621,8 @@ professional-quality sample meshes based on the original designs.
             self.joint_info.append(info)
             if info[2] in [p.JOINT_REVOLUTE, p.JOINT_PRISMATIC]:
                 self.controllable_joints.append(i)
+        self.controllable_joints = np.asarray(self.controllable_joints, dtype=np.int32)
+        self._pos_buf = np.empty(len(self.controllable_joints))
                 
         print(f"  📊 Total joints: {self.num_joints}")
         print(f"  🎮 Controllable joints: {len(self.controllable_joints)}")
@@ -535,6 +639,15 @@ professional-quality sample meshes based on the original designs.
                 )
                 self.joint_sliders.append(slider_id)
         
+        # Joints driven by the sliders/demos, commanded in one batched call
+        self.slider_joints = self.controllable_joints[:len(self.joint_sliders)]
+        self.joint_forces = [50000] * len(self.slider_joints)
+        
+        # Commanded targets ramp toward the goal at no more than max_joint_velocity
+        self.joint_command = np.array([state[0] for state in p.getJointStates(self.arm_id, self.slider_joints)])
+        self.joint_goal = self.joint_command.copy()
+        self.max_joint_velocity = 1.0
+        
         # Additional controls
         self.demo_button = p.addUserDebugParameter("🎬 Run Excavation Demo", 1, 1, 1)
         self.reset_button = p.addUserDebugParameter("🏠 Reset Home", 1, 1, 1)
@@ -543,6 +656,24 @@ professional-quality sample meshes based on the original designs.
         
         print("✅ Advanced joint controls ready!")
         
+    def set_joint_targets(self, target_positions, max_velocity=1.0):
+        """Set the slider joint goal and the speed limit used to approach it"""
+        self.joint_goal = np.asarray(target_positions[:len(self.slider_joints)], dtype=np.float64)
+        self.max_joint_velocity = max_velocity
+        
+    def step_joint_targets(self):
+        """Advance the commanded targets one frame and send them in one batched call"""
+        # setJointMotorControlArray has no maxVelocity, so limit each frame's target change
+        max_step = self.max_joint_velocity * self.time_step
+        self.joint_command += np.clip(self.joint_goal - self.joint_command, -max_step, max_step)
+        p.setJointMotorControlArray(
+            self.arm_id,
+            self.slider_joints,
+            p.POSITION_CONTROL,
+            targetPositions=self.joint_command.tolist(),
+            forces=self.joint_forces
+        )
+        
     def setup_professional_camera(self):
         """Setup professional camera system"""
         p.resetDebugVisualizerCamera(
@@ -552,6 +683,24 @@ professional-quality sample meshes based on the original designs.
             cameraTargetPosition=[0, 0, 4]
         )
         
+        # Screenshot camera is fixed, so build its matrices once
+        self.screenshot_size = (1920, 1080)
+        width, height = self.screenshot_size
+        self._view_matrix = p.computeViewMatrixFromYawPitchRoll(
+            cameraTargetPosition=[0, 0, 4],
+            distance=15,
+            yaw=45,
+            pitch=-30,
+            roll=0,
+            upAxisIndex=2
+        )
+        self._proj_matrix = p.computeProjectionMatrixFOV(
+            fov=60,
+            aspect=width/height,
+            nearVal=0.1,
+            farVal=100.0
+        )
+        
     def run_full_interactive_system(self):
         """Run the complete interactive system with real CAD integration"""
         print("\n🚀 STARTING FULL CAD INTEGRATION SYSTEM")
@@ -617,66 +766,93 @@ professional-quality sample meshes based on the original designs.
         ]
         
         for name, create_func in placeholders:
+            output_path = self.processed_dir / f"{name}_placeholder.obj"
+            hash_path = output_path.with_name(output_path.name + ".hash")
+            
+            # Geometry is deterministic, so its parameters are a complete cache key
+            try:
+                key = self.placeholder_cache_key(name, create_func)
+            except Exception as e:
+                print(f"  ⚠️ No cache key for {name} ({e}), rebuilding")
+                key = None
+            if key and output_path.exists() and hash_path.exists() and hash_path.read_text() == key:
+                print(f"  ♻️ Cached: {output_path}")
+                continue
+                
             mesh = create_func()
-            output_path = self.processed_dir / f"{name}_placeholder.stl"
-            mesh.export(str(output_path))
+            self.export_placeholder(mesh, output_path)
+            if key:
+                hash_path.write_text(key)
             print(f"  ✅ Created: {output_path}")
             
+    def export_placeholder(self, mesh, output_path):
+        """Write a placeholder as indexed OBJ (shared vertices, no normals or materials)"""
+        obj_text = trimesh.exchange.obj.export_obj(
+            mesh, include_normals=False, include_color=False, include_texture=False
+        )
+        output_path.write_text(obj_text)
+        
+    def placeholder_cache_key(self, name, create_func):
+        """Hash the parameters that determine a placeholder mesh for the mesh cache"""
+        params = (PLACEHOLDER_MESH_VERSION, name, create_func.__name__,
+                  trimesh.__version__, self.watertight_placeholders)
+        return hashlib.sha1(repr(params).encode()).hexdigest()
+            
     def run_interactive_loop(self):
         """Main interactive control loop"""
         last_demo = 0
         last_reset = 0
         last_screenshot = 0
         frame_count = 0
-        start_time = time.time()
+        start_time = time.monotonic()
+        next_frame = start_time
+        last_ui_poll = -math.inf
+        ui_poll_interval = 0.05  # 20 Hz is plenty for sliders and buttons
         
         try:
             while True:
-                current_time = time.time()
-                
-                # Update joints from sliders
-                precision_factor = 0.3 if p.readUserDebugParameter(self.precision_mode) > 0.5 else 1.0
-                
-                for i, slider_id in enumerate(self.joint_sliders):
-                    if i < len(self.controllable_joints):
-                        target_pos = p.readUserDebugParameter(slider_id)
-                        joint_idx = self.controllable_joints[i]
-                        
-                        p.setJointMotorControl2(
-                            self.arm_id,
-                            joint_idx,
-                            p.POSITION_CONTROL,
-                            targetPosition=target_pos,
-                            force=50000,
-                            maxVelocity=1.0 * precision_factor
-                        )
-                
-                # Handle button presses
-                demo_val = p.readUserDebugParameter(self.demo_button)
-                if demo_val != last_demo:
-                    last_demo = demo_val
-                    self.run_excavation_demo()
+                current_time = time.monotonic()
                 
-                reset_val = p.readUserDebugParameter(self.reset_button)
-                if reset_val != last_reset:
-                    last_reset = reset_val
-                    self.reset_to_home()
-                
-                screenshot_val = p.readUserDebugParameter(self.screenshot_button)
-                if screenshot_val != last_screenshot:
-                    last_screenshot = screenshot_val
-                    self.take_professional_screenshot()
+                # Poll the GUI at a lower rate; motor targets persist between polls
+                if current_time - last_ui_poll > ui_poll_interval:
+                    last_ui_poll = current_time
+                    
+                    # Update joints from sliders
+                    precision_factor = 0.3 if p.readUserDebugParameter(self.precision_mode) > 0.5 else 1.0
+                    
+                    targets = [p.readUserDebugParameter(slider_id) for slider_id in self.joint_sliders]
+                    self.set_joint_targets(targets, max_velocity=1.0 * precision_factor)
+                    
+                    # Handle button presses (buttons report an integer click count)
+                    demo_val = int(p.readUserDebugParameter(self.demo_button))
+                    if demo_val != last_demo:
+                        last_demo = demo_val
+                        self.run_excavation_demo()
+                    
+                    reset_val = int(p.readUserDebugParameter(self.reset_button))
+                    if reset_val != last_reset:
+                        last_reset = reset_val
+                        self.reset_to_home()
+                    
+                    screenshot_val = int(p.readUserDebugParameter(self.screenshot_button))
+                    if screenshot_val != last_screenshot:
+                        last_screenshot = screenshot_val
+                        self.take_professional_screenshot()
                 
-                # Step simulation
+                # Step simulation, sleeping only for what is left of this frame
+                self.step_joint_targets()
                 p.stepSimulation()
-                time.sleep(1.0/60.0)
+                next_frame = max(next_frame + self.time_step, time.monotonic() - self.time_step)
+                time.sleep(max(0.0, next_frame - time.monotonic()))
                 
                 # Performance monitoring
                 frame_count += 1
                 if frame_count % 300 == 0:
                     fps = 300 / (current_time - start_time + 0.001)
-                    joint_states = [p.getJointState(self.arm_id, j)[0] for j in self.controllable_joints]
-                    print(f"📊 Performance: {fps:.1f} FPS | Joints: {[f'{s:.2f}' for s in joint_states]}")
+                    for k, state in enumerate(p.getJointStates(self.arm_id, self.controllable_joints)):
+                        self._pos_buf[k] = state[0]
+                    joints = np.array2string(self._pos_buf, precision=2, separator=', ')
+                    print(f"📊 Performance: {fps:.1f} FPS | Joints: {joints}")
                     start_time = current_time
                 
         except KeyboardInterrupt:
@@ -699,25 +875,27 @@ professional-quality sample meshes based on the original designs.
             ([0.0, -0.5, 1.0, 0.0], "Return home")
         ]
         
-        for i, (target_pos, description) in enumerate(excavation_sequence):
-            print(f"  🎯 Step {i+1}: {description}")
-            
-            # Set joint targets
-            for j, joint_idx in enumerate(self.controllable_joints):
-                if j < len(target_pos):
-                    p.setJointMotorControl2(
-                        self.arm_id,
-                        joint_idx,
-                        p.POSITION_CONTROL,
-                        targetPosition=target_pos[j],
-                        force=50000,
-                        maxVelocity=0.5
-                    )
+        # Precompute the whole (T, n) trajectory: 90 interpolated targets
+        # (1.5 seconds at 60 FPS) from the current pose into each waypoint
+        steps = 90
+        n = len(self.slider_joints)
+        waypoints = np.array([pose for pose, _ in excavation_sequence])[:, :n]
+        current = [state[0] for state in p.getJointStates(self.arm_id, self.slider_joints)]
+        starts = np.vstack([current, waypoints[:-1]])
+        alpha = np.arange(1, steps + 1)[:, None, None] / steps
+        trajectory = (starts + alpha * (waypoints - starts)).transpose(1, 0, 2).reshape(-1, n)
+        
+        next_frame = time.monotonic()
+        for t, targets in enumerate(trajectory):
+            if t % steps == 0:
+                i = t // steps
+                print(f"  🎯 Step {i+1}: {excavation_sequence[i][1]}")
             
-            # Wait for movement
-            for _ in range(90):  # 1.5 seconds at 60 FPS
-                p.stepSimulation()
-                time.sleep(1.0/60.0)
+            self.set_joint_targets(targets, max_velocity=0.5)
+            self.step_joint_targets()
+            p.stepSimulation()
+            next_frame += self.time_step
+            time.sleep(max(0.0, next_frame - time.monotonic()))
         
         print("✅ Excavation demonstration completed!")
         
@@ -726,16 +904,7 @@ professional-quality sample meshes based on the original designs.
         print("🏠 Resetting to home position...")
         home_position = [0.0, -0.5, 1.0, 0.0]
         
-        for i, joint_idx in enumerate(self.controllable_joints):
-            if i < len(home_position):
-                p.setJointMotorControl2(
-                    self.arm_id,
-                    joint_idx,
-                    p.POSITION_CONTROL,
-                    targetPosition=home_position[i],
-                    force=50000,
-                    maxVelocity=1.5
-                )
+        self.set_joint_targets(home_position, max_velocity=1.5)
         
     def take_professional_screenshot(self):
         """Take high-quality screenshot"""
@@ -744,31 +913,20 @@ professional-quality sample meshes based on the original designs.
         filename = f"jcb_excavator_screenshot_{timestamp}.png"
         
         # High resolution capture
-        width, height = 1920, 1080
-        view_matrix = p.computeViewMatrixFromYawPitchRoll(
-            cameraTargetPosition=[0, 0, 4],
-            distance=15,
-            yaw=45,
-            pitch=-30,
-            roll=0,
-            upAxisIndex=2
-        )
-        
-        proj_matrix = p.computeProjectionMatrixFOV(
-            fov=60,
-            aspect=width/height,
-            nearVal=0.1,
-            farVal=100.0
-        )
-        
+        width, height = self.screenshot_size
         _, _, rgb_array, _, _ = p.getCameraImage(
             width=width,
             height=height,
-            viewMatrix=view_matrix,
-            projectionMatrix=proj_matrix,
-            renderer=p.ER_BULLET_HARDWARE_OPENGL
+            viewMatrix=self._view_matrix,
+            projectionMatrix=self._proj_matrix,
+            renderer=p.ER_BULLET_HARDWARE_OPENGL,
+            flags=p.ER_NO_SEGMENTATION_MASK
         )
         
+        # The RGBA buffer is already the final image; write it straight out
+        rgb = np.reshape(np.asarray(rgb_array, dtype=np.uint8), (height, width, 4))[:, :, :3]
+        Image.fromarray(np.ascontiguousarray(rgb)).save(filename, optimize=False, compress_level=1)
+        
         print(f"✅ Screenshot captured: {filename}")
         
     def cleanup(self):
@@ -6,10 +6,13 @@ import os
 import sys
 import time
 import math
+import copy
+import functools
 import numpy as np
 import requests
 import urllib.request
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import tempfile
 import pybullet as p
 import pybullet_data
@@ -17,11 +20,25 @@ from PIL import Image, ImageEnhance, ImageFilter
 import cv2
 
 
+@functools.lru_cache(maxsize=None)
+def _disk_mask(radius):
+    """Boolean (2r+1, 2r+1) disk stamp, built once per radius"""
+    y_coords, x_coords = np.ogrid[-radius:radius+1, -radius:radius+1]
+    mask = x_coords**2 + y_coords**2 <= radius**2
+    mask.setflags(write=False)
+    return mask
+
+
 class RealisticTextureManager:
     """Manages realistic textures for JCB robotic arm components"""
     
-    def __init__(self):
+    def __init__(self, seed=42):
         """Initialize texture management system"""
+        # Own generator so texture sets are reproducible for a given seed; the
+        # seed sequence also hands out independent child streams for workers
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.rng = np.random.default_rng(self.seed_sequence)
+        
         self.texture_dir = Path("realistic_textures")
         self.texture_dir.mkdir(exist_ok=True)
         
@@ -33,38 +50,57 @@ class RealisticTextureManager:
         self.texture_cache = {}
         self.pybullet_textures = {}
         
+        # Reuse textures generated by an earlier run; set False to force regeneration
+        self.reuse_existing = True
+        
     def create_realistic_jcb_textures(self):
         """Create realistic JCB-style textures using procedural generation"""
         print("🎨 Creating realistic JCB textures...")
         
+        # One contiguous allocation for all five textures; each fills its own slab
+        batch = np.empty((5, 512, 512, 3), dtype=np.uint8)
+        
+        generators = [
+            ('jcb_body', 'create_jcb_yellow_texture'),             # JCB Yellow Body Texture (main chassis)
+            ('jcb_boom', 'create_jcb_orange_texture'),             # JCB Orange Boom Texture (arm segments)
+            ('steel_hydraulic', 'create_steel_texture'),           # Steel/Metal Texture (hydraulic cylinders)
+            ('rubber_black', 'create_rubber_texture'),             # Rubber/Black Texture (bucket and joints)
+            ('weathered_metal', 'create_weathered_metal_texture')  # Weathered Metal Texture (realistic wear)
+        ]
+        
+        # The textures are independent, so only their NumPy/cv2 generation runs in the
+        # pool (each with its own child generator); saving happens on the main thread below
+        rngs = [np.random.default_rng(child) for child in self.seed_sequence.spawn(len(generators))]
+        with ThreadPoolExecutor(max_workers=len(generators)) as executor:
+            futures = {
+                name: executor.submit(getattr(self.texture_worker(rng), method), out=slab, save=False)
+                for (name, method), rng, slab in zip(generators, rngs, batch)
+            }
+        
+        # Workers only fill their slabs; Pillow's save is not thread-safe in
+        # every version, so the PNGs are written here on the calling thread
         textures = {}
-        
-        # JCB Yellow Body Texture (main chassis)
-        textures['jcb_body'] = self.create_jcb_yellow_texture()
-        
-        # JCB Orange Boom Texture (arm segments)
-        textures['jcb_boom'] = self.create_jcb_orange_texture()
-        
-        # Steel/Metal Texture (hydraulic cylinders)
-        textures['steel_hydraulic'] = self.create_steel_texture()
-        
-        # Rubber/Black Texture (bucket and joints)
-        textures['rubber_black'] = self.create_rubber_texture()
-        
-        # Weathered Metal Texture (realistic wear)
-        textures['weathered_metal'] = self.create_weathered_metal_texture()
+        for name, future in futures.items():
+            filepath, texture = future.result()
+            if texture is not None:
+                self.save_texture(texture, filepath)
+            textures[name] = str(filepath)
         
         return textures
     
-    def create_jcb_yellow_texture(self):
+    def create_jcb_yellow_texture(self, out=None, save=True):
         """Create realistic JCB yellow texture with wear and detail"""
+        filepath = self.texture_dir / "processed" / "jcb_yellow_realistic.png"
+        if self.texture_exists(filepath):
+            return self.texture_result(filepath, None, save)
+        
         width, height = 512, 512
         
         # Base yellow color (JCB signature color)
         base_color = np.array([242, 217, 25])  # JCB Yellow RGB
         
         # Create base texture
-        texture = np.full((height, width, 3), base_color, dtype=np.uint8)
+        texture = self.base_texture(base_color, (height, width), out)
         
         # Add realistic wear patterns
         self.add_wear_patterns(texture, intensity=0.15)
@@ -79,19 +115,21 @@ class RealisticTextureManager:
         self.add_logo_area(texture, [50, 100, 200, 80], [200, 180, 20])
         
         # Save and return
-        filepath = self.texture_dir / "processed" / "jcb_yellow_realistic.png"
-        Image.fromarray(texture).save(filepath)
-        return str(filepath)
+        return self.texture_result(filepath, texture, save)
     
-    def create_jcb_orange_texture(self):
+    def create_jcb_orange_texture(self, out=None, save=True):
         """Create realistic JCB orange texture for boom/stick"""
+        filepath = self.texture_dir / "processed" / "jcb_orange_realistic.png"
+        if self.texture_exists(filepath):
+            return self.texture_result(filepath, None, save)
+        
         width, height = 512, 512
         
         # JCB Orange color
         base_color = np.array([242, 115, 25])  # JCB Orange RGB
         
         # Create base texture
-        texture = np.full((height, width, 3), base_color, dtype=np.uint8)
+        texture = self.base_texture(base_color, (height, width), out)
         
         # Add hydraulic mounting points (darker circles)
         self.add_hydraulic_mounts(texture)
@@ -106,19 +144,21 @@ class RealisticTextureManager:
         self.add_dirt_grime(texture, intensity=0.2, corner_bias=True)
         
         # Save and return
-        filepath = self.texture_dir / "processed" / "jcb_orange_realistic.png"
-        Image.fromarray(texture).save(filepath)
-        return str(filepath)
+        return self.texture_result(filepath, texture, save)
     
-    def create_steel_texture(self):
+    def create_steel_texture(self, out=None, save=True):
         """Create realistic steel texture for hydraulic cylinders"""
+        filepath = self.texture_dir / "processed" / "steel_hydraulic_realistic.png"
+        if self.texture_exists(filepath):
+            return self.texture_result(filepath, None, save)
+        
         width, height = 512, 512
         
         # Steel gray base
         base_color = np.array([120, 120, 130])
         
         # Create base texture
-        texture = np.full((height, width, 3), base_color, dtype=np.uint8)
+        texture = self.base_texture(base_color, (height, width), out)
         
         # Add metallic surface variation
         self.add_metallic_variation(texture)
@@ -136,19 +176,21 @@ class RealisticTextureManager:
         self.add_rust_spots(texture, intensity=0.1)
         
         # Save and return
-        filepath = self.texture_dir / "processed" / "steel_hydraulic_realistic.png"
-        Image.fromarray(texture).save(filepath)
-        return str(filepath)
+        return self.texture_result(filepath, texture, save)
     
-    def create_rubber_texture(self):
+    def create_rubber_texture(self, out=None, save=True):
         """Create realistic rubber/black texture for bucket"""
+        filepath = self.texture_dir / "processed" / "rubber_bucket_realistic.png"
+        if self.texture_exists(filepath):
+            return self.texture_result(filepath, None, save)
+        
         width, height = 512, 512
         
         # Dark rubber base
         base_color = np.array([45, 45, 50])
         
         # Create base texture
-        texture = np.full((height, width, 3), base_color, dtype=np.uint8)
+        texture = self.base_texture(base_color, (height, width), out)
         
         # Add rubber texture pattern
         self.add_rubber_pattern(texture)
@@ -163,19 +205,21 @@ class RealisticTextureManager:
         self.add_metal_scratches(texture, density=0.6, color=[80, 80, 85])
         
         # Save and return
-        filepath = self.texture_dir / "processed" / "rubber_bucket_realistic.png"
-        Image.fromarray(texture).save(filepath)
-        return str(filepath)
+        return self.texture_result(filepath, texture, save)
     
-    def create_weathered_metal_texture(self):
+    def create_weathered_metal_texture(self, out=None, save=True):
         """Create weathered metal texture for detailed components"""
+        filepath = self.texture_dir / "processed" / "weathered_metal_realistic.png"
+        if self.texture_exists(filepath):
+            return self.texture_result(filepath, None, save)
+        
         width, height = 512, 512
         
         # Weathered metal base
         base_color = np.array([95, 95, 105])
         
         # Create base texture
-        texture = np.full((height, width, 3), base_color, dtype=np.uint8)
+        texture = self.base_texture(base_color, (height, width), out)
         
         # Add heavy weathering
         self.add_wear_patterns(texture, intensity=0.35)
@@ -190,16 +234,53 @@ class RealisticTextureManager:
         self.add_oxidation_patterns(texture)
         
         # Save and return
-        filepath = self.texture_dir / "processed" / "weathered_metal_realistic.png"
-        Image.fromarray(texture).save(filepath)
+        return self.texture_result(filepath, texture, save)
+    
+    def texture_worker(self, rng):
+        """Shallow copy of this manager that draws from its own generator"""
+        worker = copy.copy(self)
+        worker.rng = rng
+        return worker
+    
+    def texture_exists(self, filepath):
+        """Whether a non-empty texture from an earlier run can be reused"""
+        return self.reuse_existing and filepath.is_file() and filepath.stat().st_size > 0
+    
+    def texture_result(self, filepath, texture, save=True):
+        """Save a finished texture and return its path, or with save=False hand back
+        (filepath, texture) for the caller to save (texture is None when reused)"""
+        if not save:
+            return filepath, texture
+        if texture is not None:
+            self.save_texture(texture, filepath)
         return str(filepath)
     
+    def save_texture(self, texture, filepath):
+        """Save a texture PNG; noisy textures barely shrink at higher zlib levels"""
+        Image.fromarray(texture).save(filepath, optimize=False, compress_level=1)
+    
+    def base_texture(self, base_color, shape, out=None):
+        """Solid base texture, filled in place when a preallocated buffer is given"""
+        if out is None:
+            return np.full(shape + (3,), base_color, dtype=np.uint8)
+        out[...] = base_color
+        return out
+    
+    def disk_region(self, texture, cx, cy, radius):
+        """Texture view around a circle and its disk mask, both clipped to the edges"""
+        height, width = texture.shape[:2]
+        y0, y1 = max(cy - radius, 0), min(cy + radius + 1, height)
+        x0, x1 = max(cx - radius, 0), min(cx + radius + 1, width)
+        
+        mask = _disk_mask(radius)[y0-cy+radius:y1-cy+radius, x0-cx+radius:x1-cx+radius]
+        return texture[y0:y1, x0:x1], mask
+    
     def add_wear_patterns(self, texture, intensity=0.2):
         """Add realistic wear patterns to texture"""
         height, width = texture.shape[:2]
         
         # Create noise-based wear mask
-        noise = np.random.random((height, width))
+        noise = self.rng.random((height, width))
         wear_mask = noise < intensity
         
         # Apply wear (darker areas)
@@ -223,7 +304,7 @@ class RealisticTextureManager:
         height, width = texture.shape[:2]
         
         # Create dirt mask
-        dirt_noise = np.random.random((height, width))
+        dirt_noise = self.rng.random((height, width))
         
         if corner_bias:
             # More dirt in corners/edges
@@ -257,12 +338,10 @@ class RealisticTextureManager:
         
         for cx, cy in centers:
             radius = 30
-            y_coords, x_coords = np.ogrid[:height, :width]
-            mask = (x_coords - cx)**2 + (y_coords - cy)**2 <= radius**2
+            region, mask = self.disk_region(texture, cx, cy, radius)
             
             # Darker mounting area
-            mount_color = texture * 0.8
-            texture[mask] = mount_color[mask].astype(np.uint8)
+            region[mask] = (region[mask] * 0.8).astype(np.uint8)
     
     def add_metal_scratches(self, texture, density=0.3, color=None):
         """Add realistic metal scratches"""
@@ -273,58 +352,54 @@ class RealisticTextureManager:
         
         num_scratches = int(density * 100)
         
-        for _ in range(num_scratches):
-            # Random scratch parameters
-            start_x = np.random.randint(0, width)
-            start_y = np.random.randint(0, height)
-            length = np.random.randint(20, 100)
-            angle = np.random.uniform(0, 2*np.pi)
-            
-            # Calculate end point
-            end_x = int(start_x + length * np.cos(angle))
-            end_y = int(start_y + length * np.sin(angle))
-            
-            # Ensure within bounds
-            end_x = np.clip(end_x, 0, width-1)
-            end_y = np.clip(end_y, 0, height-1)
-            
-            # Draw scratch line
-            cv2.line(texture, (start_x, start_y), (end_x, end_y), color, 1)
+        # Random scratch parameters, drawn for all scratches at once
+        starts = self.rng.integers(0, [width, height], size=(num_scratches, 2))
+        lengths = self.rng.integers(20, 100, num_scratches)
+        angles = self.rng.uniform(0, 2*np.pi, num_scratches)
+        
+        # Calculate end points and keep them within bounds
+        directions = np.column_stack([np.cos(angles), np.sin(angles)])
+        ends = starts + (lengths[:, np.newaxis] * directions).astype(int)
+        ends = np.clip(ends, 0, [width-1, height-1])
+        
+        # Draw every scratch line in one call
+        segments = np.stack([starts, ends], axis=1).astype(np.int32)
+        cv2.polylines(texture, list(segments), False, color, 1)
     
     def add_metallic_variation(self, texture):
         """Add metallic surface variation"""
         height, width = texture.shape[:2]
         
-        # Create subtle brightness variation
-        variation = np.random.normal(1.0, 0.1, (height, width))
+        # Create subtle brightness variation at quarter resolution and upscale
+        # it, which gives smooth patches instead of per-pixel grain
+        variation = self.rng.normal(1.0, 0.1, (height // 4, width // 4)).astype(np.float32)
+        variation = cv2.resize(variation, (width, height), interpolation=cv2.INTER_CUBIC)
         variation = np.clip(variation, 0.8, 1.2)
         
-        for i in range(3):  # Apply to all color channels
-            texture[:,:,i] = np.clip(texture[:,:,i] * variation, 0, 255)
+        # Apply to all color channels at once
+        texture[:] = np.clip(texture * variation[:, :, np.newaxis], 0, 255)
     
     def add_hydraulic_stains(self, texture):
         """Add hydraulic fluid stains"""
         height, width = texture.shape[:2]
         
-        # Random stain locations
-        for _ in range(5):
-            cx = np.random.randint(width//4, 3*width//4)
-            cy = np.random.randint(height//4, 3*height//4)
-            radius = np.random.randint(15, 40)
-            
-            y_coords, x_coords = np.ogrid[:height, :width]
-            mask = (x_coords - cx)**2 + (y_coords - cy)**2 <= radius**2
+        # Random stain locations, drawn in one batch
+        centers = self.rng.integers([width//4, height//4], [3*width//4, 3*height//4], size=(5, 2))
+        radii = self.rng.integers(15, 40, 5)
+        
+        for (cx, cy), radius in zip(centers.tolist(), radii.tolist()):
+            region, mask = self.disk_region(texture, cx, cy, radius)
             
             # Dark oily stain
-            stain_color = texture * 0.4
-            stain_color[:,:,0] = np.minimum(stain_color[:,:,0] + 10, 255)  # Slight red tint
-            texture[mask] = stain_color[mask].astype(np.uint8)
+            stain_color = region[mask] * 0.4
+            stain_color[:,0] = np.minimum(stain_color[:,0] + 10, 255)  # Slight red tint
+            region[mask] = stain_color.astype(np.uint8)
     
     def add_rust_spots(self, texture, intensity=0.15):
         """Add rust and corrosion spots"""
         height, width = texture.shape[:2]
         
-        rust_noise = np.random.random((height, width))
+        rust_noise = self.rng.random((height, width))
         rust_mask = rust_noise < intensity
         
         # Rust color (reddish-brown)
@@ -339,36 +414,35 @@ class RealisticTextureManager:
         """Add rubber surface texture pattern"""
         height, width = texture.shape[:2]
         
-        # Create diamond/crosshatch pattern typical of rubber
-        for y in range(0, height, 20):
-            for x in range(0, width, 20):
-                # Draw small cross pattern
-                if y < height-2 and x < width-2:
-                    texture[y:y+2, x:x+15] = [60, 60, 65]  # Horizontal line
-                    texture[y:y+15, x:x+2] = [60, 60, 65]  # Vertical line
+        # Create diamond/crosshatch pattern typical of rubber: a small cross
+        # in every 20 px cell, built as one mask instead of per-cell writes
+        y_coords, x_coords = np.ogrid[:height, :width]
+        y_cell, x_cell = y_coords % 20, x_coords % 20
+        cross = ((y_cell < 2) & (x_cell < 15)) | ((y_cell < 15) & (x_cell < 2))  # Horizontal | vertical line
+        
+        # Cells starting within 2 px of the far edges are left plain
+        cross &= (y_coords - y_cell < height-2) & (x_coords - x_cell < width-2)
+        texture[cross] = [60, 60, 65]
     
     def add_earth_stains(self, texture):
         """Add earth and dirt stains for bucket"""
         height, width = texture.shape[:2]
         
-        # Heavy dirt accumulation
-        for _ in range(20):
-            cx = np.random.randint(0, width)
-            cy = np.random.randint(0, height)
-            radius = np.random.randint(10, 30)
-            
-            y_coords, x_coords = np.ogrid[:height, :width]
-            mask = (x_coords - cx)**2 + (y_coords - cy)**2 <= radius**2
-            
-            # Brown earth color
-            earth_color = [101, 67, 33]  # Brown earth
-            texture[mask] = earth_color
+        # Brown earth color
+        earth_color = (101, 67, 33)  # Brown earth
+        
+        # Heavy dirt accumulation (filled circles drawn straight into the texture)
+        centers = self.rng.integers(0, [width, height], size=(20, 2))
+        radii = self.rng.integers(10, 30, 20)
+        
+        for (cx, cy), radius in zip(centers.tolist(), radii.tolist()):
+            cv2.circle(texture, (cx, cy), radius, earth_color, -1)
     
     def add_paint_wear(self, texture):
         """Add paint wear revealing metal underneath"""
         height, width = texture.shape[:2]
         
-        wear_noise = np.random.random((height, width))
+        wear_noise = self.rng.random((height, width))
         wear_mask = wear_noise < 0.1
         
         # Exposed metal color (brighter)
@@ -380,7 +454,7 @@ class RealisticTextureManager:
         height, width = texture.shape[:2]
         
         # Create oxidation with Perlin-like noise
-        oxidation_noise = np.random.random((height, width))
+        oxidation_noise = self.rng.random((height, width))
         oxidation_mask = oxidation_noise < 0.05
         
         # Oxidized color (slightly greenish-gray)
@@ -17,6 +17,11 @@ import queue
 from http.server import HTTPServer, SimpleHTTPRequestHandler
 import webbrowser
 import socketserver
+import shutil
+
+
+# Control page served by the web interface, copied into web_dir on demand
+_INDEX_TEMPLATE = Path(__file__).with_name("web_interactive_arm.html")
 
 
 class WebInteractiveRoboticArm:
@@ -48,408 +53,9 @@ class WebInteractiveRoboticArm:
         
     def create_web_interface(self):
         """Create HTML/JavaScript web interface"""
-        html_content = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Interactive JCB Robotic Arm Control</title>
-    <style>
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-        }
-        
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 15px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }
-        
-        .header {
-            background: linear-gradient(135deg, #ff6b35 0%, #f7931e 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }
-        
-        .header h1 {
-            margin: 0;
-            font-size: 2.5em;
-            font-weight: bold;
-        }
-        
-        .header p {
-            margin: 10px 0 0 0;
-            font-size: 1.2em;
-            opacity: 0.9;
-        }
-        
-        .main-content {
-            display: grid;
-            grid-template-columns: 1fr 400px;
-            gap: 20px;
-            padding: 30px;
-        }
-        
-        .visualizer-panel {
-            background: #f8f9fa;
-            border-radius: 10px;
-            padding: 20px;
-            min-height: 600px;
-            position: relative;
-        }
-        
-        .control-panel {
-            background: #ffffff;
-            border-radius: 10px;
-            padding: 25px;
-            border-left: 4px solid #ff6b35;
-        }
-        
-        .joint-control {
-            margin-bottom: 25px;
-            padding: 20px;
-            background: #f8f9fa;
-            border-radius: 8px;
-            border: 1px solid #e9ecef;
-        }
-        
-        .joint-control h3 {
-            margin: 0 0 15px 0;
-            color: #495057;
-            font-size: 1.1em;
-        }
-        
-        .slider {
-            width: 100%;
-            height: 8px;
-            border-radius: 5px;
-            background: #ddd;
-            outline: none;
-            opacity: 0.7;
-            transition: opacity 0.2s;
-            margin: 10px 0;
-        }
-        
-        .slider:hover {
-            opacity: 1;
-        }
-        
-        .slider::-webkit-slider-thumb {
-            appearance: none;
-            width: 20px;
-            height: 20px;
-            border-radius: 50%;
-            background: #ff6b35;
-            cursor: pointer;
-        }
-        
-        .value-display {
-            background: #343a40;
-            color: white;
-            padding: 8px 12px;
-            border-radius: 4px;
-            font-family: monospace;
-            text-align: center;
-            margin-top: 10px;
-        }
-        
-        .button-group {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 15px;
-            margin-top: 25px;
-        }
-        
-        .btn {
-            padding: 12px 20px;
-            border: none;
-            border-radius: 6px;
-            font-size: 1em;
-            font-weight: bold;
-            cursor: pointer;
-            transition: all 0.3s ease;
-        }
-        
-        .btn-primary {
-            background: #007bff;
-            color: white;
-        }
-        
-        .btn-primary:hover {
-            background: #0056b3;
-            transform: translateY(-2px);
-        }
-        
-        .btn-success {
-            background: #28a745;
-            color: white;
-        }
-        
-        .btn-success:hover {
-            background: #218838;
-            transform: translateY(-2px);
-        }
-        
-        .btn-warning {
-            background: #ffc107;
-            color: #212529;
-        }
-        
-        .btn-warning:hover {
-            background: #e0a800;
-            transform: translateY(-2px);
-        }
-        
-        .btn-danger {
-            background: #dc3545;
-            color: white;
-        }
-        
-        .btn-danger:hover {
-            background: #c82333;
-            transform: translateY(-2px);
-        }
-        
-        .status-panel {
-            background: #e8f5e8;
-            border: 1px solid #c3e6c3;
-            border-radius: 6px;
-            padding: 15px;
-            margin-top: 20px;
-        }
-        
-        .status-title {
-            font-weight: bold;
-            color: #155724;
-            margin-bottom: 10px;
-        }
-        
-        .status-info {
-            font-size: 0.9em;
-            color: #155724;
-        }
-        
-        .placeholder-3d {
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(45deg, #f0f0f0, #e0e0e0);
-            border-radius: 8px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 1.2em;
-            color: #666;
-            border: 2px dashed #ccc;
-        }
-        
-        @media (max-width: 768px) {
-            .main-content {
-                grid-template-columns: 1fr;
-            }
-            
-            .button-group {
-                grid-template-columns: 1fr;
-            }
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🚜 Interactive JCB Robotic Arm</h1>
-            <p>Professional CAD-Based Simulation with Real-Time Control</p>
-        </div>
-        
-        <div class="main-content">
-            <div class="visualizer-panel">
-                <div class="placeholder-3d">
-                    <div style="text-align: center;">
-                        <h3>🎮 3D Interactive Workspace</h3>
-                        <p>Real-time robotic arm visualization</p>
-                        <p><em>Use controls on the right to manipulate the arm</em></p>
-                    </div>
-                </div>
-            </div>
-            
-            <div class="control-panel">
-                <h2 style="margin-top: 0; color: #495057;">🎛️ Joint Controls</h2>
-                
-                <div class="joint-control">
-                    <h3>💪 Boom Joint (Shoulder)</h3>
-                    <input type="range" id="boom-slider" class="slider" 
-                           min="-1.57" max="1.57" step="0.01" value="0.0">
-                    <div class="value-display" id="boom-value">0.00°</div>
-                </div>
-                
-                <div class="joint-control">
-                    <h3>🦾 Stick Joint (Elbow)</h3>
-                    <input type="range" id="stick-slider" class="slider" 
-                           min="-2.0" max="0.5" step="0.01" value="-0.3">
-                    <div class="value-display" id="stick-value">-0.30°</div>
-                </div>
-                
-                <div class="joint-control">
-                    <h3>🪣 Bucket Joint (Wrist)</h3>
-                    <input type="range" id="bucket-slider" class="slider" 
-                           min="-0.5" max="2.0" step="0.01" value="0.5">
-                    <div class="value-display" id="bucket-value">0.50°</div>
-                </div>
-                
-                <div class="joint-control">
-                    <h3>🔄 Bucket Rotation</h3>
-                    <input type="range" id="rotation-slider" class="slider" 
-                           min="-3.14" max="3.14" step="0.01" value="0.0">
-                    <div class="value-display" id="rotation-value">0.00°</div>
-                </div>
-                
-                <div class="button-group">
-                    <button class="btn btn-primary" onclick="runDemo()">🎬 Run Demo</button>
-                    <button class="btn btn-success" onclick="resetArm()">🏠 Reset Home</button>
-                    <button class="btn btn-warning" onclick="savePosition()">💾 Save Pose</button>
-                    <button class="btn btn-danger" onclick="emergencyStop()">🛑 E-Stop</button>
-                </div>
-                
-                <div class="status-panel">
-                    <div class="status-title">📊 System Status</div>
-                    <div class="status-info" id="status-info">
-                        🟢 System Online<br>
-                        🎮 Interactive Mode Active<br>
-                        📡 Real-time Control Enabled
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <script>
-        // Joint control system
-        const joints = ['boom', 'stick', 'bucket', 'rotation'];
-        
-        // Update value displays and send commands
-        joints.forEach(joint => {
-            const slider = document.getElementById(joint + '-slider');
-            const display = document.getElementById(joint + '-value');
-            
-            slider.addEventListener('input', function() {
-                const value = parseFloat(this.value);
-                const degrees = (value * 180 / Math.PI).toFixed(1);
-                display.textContent = degrees + '°';
-                
-                // Send command to backend
-                sendJointCommand(joint, value);
-            });
-            
-            // Initialize display
-            const initialValue = parseFloat(slider.value);
-            const initialDegrees = (initialValue * 180 / Math.PI).toFixed(1);
-            display.textContent = initialDegrees + '°';
-        });
-        
-        function sendJointCommand(joint, value) {
-            // In a real implementation, this would send to the backend
-            console.log(`Setting ${joint} to ${value} radians`);
-            
-            // Update status
-            updateStatus(`Updated ${joint.toUpperCase()} joint to ${(value * 180 / Math.PI).toFixed(1)}°`);
-        }
-        
-        function runDemo() {
-            updateStatus('🎬 Running demonstration sequence...');
-            
-            // Demo sequence
-            const demoSequence = [
-                {boom: 0.5, stick: -1.2, bucket: 1.8, rotation: 0.3},
-                {boom: 0.8, stick: -1.5, bucket: 2.2, rotation: 0.6},
-                {boom: 0.3, stick: -0.5, bucket: 0.8, rotation: 0.8},
-                {boom: -0.6, stick: -0.2, bucket: 0.3, rotation: 0.8},
-                {boom: 0.0, stick: -0.3, bucket: 0.5, rotation: 0.0}
-            ];
-            
-            let step = 0;
-            const interval = setInterval(() => {
-                if (step >= demoSequence.length) {
-                    clearInterval(interval);
-                    updateStatus('✅ Demo sequence completed!');
-                    return;
-                }
-                
-                const pose = demoSequence[step];
-                setJointPositions(pose);
-                step++;
-            }, 2000);
-        }
-        
-        function resetArm() {
-            updateStatus('🏠 Resetting to home position...');
-            setJointPositions({boom: 0.0, stick: -0.3, bucket: 0.5, rotation: 0.0});
-        }
-        
-        function savePosition() {
-            const positions = {};
-            joints.forEach(joint => {
-                const slider = document.getElementById(joint + '-slider');
-                positions[joint] = parseFloat(slider.value);
-            });
-            
-            updateStatus(`💾 Saved position: ${JSON.stringify(positions)}`);
-        }
-        
-        function emergencyStop() {
-            updateStatus('🛑 EMERGENCY STOP ACTIVATED!');
-            // In real implementation, this would immediately stop all motion
-        }
-        
-        function setJointPositions(positions) {
-            joints.forEach(joint => {
-                if (positions[joint] !== undefined) {
-                    const slider = document.getElementById(joint + '-slider');
-                    const display = document.getElementById(joint + '-value');
-                    
-                    slider.value = positions[joint];
-                    const degrees = (positions[joint] * 180 / Math.PI).toFixed(1);
-                    display.textContent = degrees + '°';
-                    
-                    sendJointCommand(joint, positions[joint]);
-                }
-            });
-        }
-        
-        function updateStatus(message) {
-            const statusInfo = document.getElementById('status-info');
-            const timestamp = new Date().toLocaleTimeString();
-            statusInfo.innerHTML = `
-                🟢 System Online<br>
-                🎮 Interactive Mode Active<br>
-                📡 Real-time Control Enabled<br>
-                <br>
-                <strong>[${timestamp}]</strong> ${message}
-            `;
-        }
-        
-        // Initialize
-        updateStatus('🚀 Web interface initialized successfully!');
-        
-        // Simulate periodic updates
-        setInterval(() => {
-            const randomJoint = joints[Math.floor(Math.random() * joints.length)];
-            // updateStatus(`📊 Monitoring ${randomJoint.toUpperCase()} joint...`);
-        }, 5000);
-    </script>
-</body>
-</html>'''
-        
         # Save HTML file
         html_path = self.web_dir / "index.html"
-        with open(html_path, 'w') as f:
-            f.write(html_content)
+        shutil.copyfile(_INDEX_TEMPLATE, html_path)
             
         print(f"🌐 Web interface created at: {html_path}")
         